@@ -0,0 +1,27 @@
+from datetime import timedelta
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from app.api.deps import DB
+from app.core.security import verify_password, create_access_token
+from app.core.config import settings
+from app.models.user import User
+from app.schemas.auth import Token
+
+router = APIRouter()
+
+
+@router.post("/token", response_model=Token)
+def login(db: DB, form_data: OAuth2PasswordRequestForm = Depends()):
+    user = db.execute(select(User).where(User.email == form_data.username)).scalar_one_or_none()
+    if not user or not verify_password(form_data.password, user.hashed_password):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    access_token = create_access_token(
+        data={"sub": str(user.id)},
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+    return {"access_token": access_token, "token_type": "bearer"}
@@ -0,0 +1,64 @@
+import threading
+import time
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from sqlalchemy import select
+from app.api.deps import DB, CurrentUser
+from app.models.item import Item
+from app.schemas.item import ItemCreate, ItemResponse
+
+router = APIRouter()
+
+# Serialized list pages keyed by (skip, limit). The TTL bounds staleness across
+# workers; create_item clears this process's copy immediately. Sync endpoints
+# run in a threadpool, so a page is only stored if no clear happened since its
+# read (tracked by _LIST_CACHE_GENERATION).
+_LIST_CACHE: dict[tuple[int, int], tuple[float, bytes]] = {}
+_LIST_CACHE_SIZE = 64
+_LIST_CACHE_TTL = 5.0
+_LIST_CACHE_LOCK = threading.Lock()
+_LIST_CACHE_GENERATION = 0
+
+
+def clear_list_cache() -> None:
+    global _LIST_CACHE_GENERATION
+    with _LIST_CACHE_LOCK:
+        _LIST_CACHE_GENERATION += 1
+        _LIST_CACHE.clear()
+
+
+@router.get("/", response_model=list[ItemResponse])
+def list_items(db: DB, skip: int = 0, limit: int = 100):
+    key = (skip, limit)
+    now = time.monotonic()
+    with _LIST_CACHE_LOCK:
+        cached = _LIST_CACHE.get(key)
+        generation = _LIST_CACHE_GENERATION
+    if cached is not None and cached[0] > now:
+        return Response(content=cached[1], media_type="application/json")
+    items = db.execute(select(Item).offset(skip).limit(limit)).scalars().all()
+    body = orjson.dumps([ItemResponse.model_validate(item).model_dump() for item in items])
+    with _LIST_CACHE_LOCK:
+        if generation == _LIST_CACHE_GENERATION:
+            if len(_LIST_CACHE) >= _LIST_CACHE_SIZE:
+                _LIST_CACHE.pop(next(iter(_LIST_CACHE)), None)
+            _LIST_CACHE[key] = (now + _LIST_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json")
+
+
+@router.post("/", response_model=ItemResponse)
+def create_item(item_in: ItemCreate, db: DB, current_user: CurrentUser):
+    item = Item(**item_in.model_dump(), owner_id=current_user.id)
+    db.add(item)
+    db.commit()
+    db.refresh(item)
+    clear_list_cache()
+    return item
+
+
+@router.get("/{item_id}", response_model=ItemResponse)
+def get_item(item_id: int, db: DB):
+    item = db.get(Item, item_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
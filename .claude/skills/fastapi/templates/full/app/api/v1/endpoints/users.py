@@ -0,0 +1,28 @@
+from fastapi import APIRouter, HTTPException
+from sqlalchemy import select
+from app.api.deps import DB, CurrentUser
+from app.models.user import User
+from app.schemas.user import UserCreate, UserResponse
+from app.core.security import hash_password
+
+router = APIRouter()
+
+
+@router.get("/me", response_model=UserResponse)
+def read_current_user(current_user: CurrentUser):
+    return current_user
+
+
+@router.post("/", response_model=UserResponse)
+def create_user(user_in: UserCreate, db: DB):
+    existing = db.execute(select(User).where(User.email == user_in.email)).scalar_one_or_none()
+    if existing:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    user = User(
+        email=user_in.email,
+        hashed_password=hash_password(user_in.password),
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+from app.api.v1.endpoints import auth, users, items
+
+api_router = APIRouter()
+api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
+api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(items.router, prefix="/items", tags=["items"])
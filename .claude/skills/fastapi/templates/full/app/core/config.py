@@ -0,0 +1,26 @@
+from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+
+class Settings(BaseSettings):
+    PROJECT_NAME: str = "My API"
+    VERSION: str = "0.1.0"
+    API_V1_STR: str = "/api/v1"
+    DEBUG: bool = False
+
+    DATABASE_URL: str = "sqlite:///./app.db"
+    CREATE_TABLES_ON_STARTUP: bool = True
+    SECRET_KEY: str = "change-me-in-production"
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+
+    CORS_ORIGINS: list[str] = ["http://localhost:3000"]
+
+    model_config = {"env_file": ".env"}
+
+
+@lru_cache
+def get_settings():
+    return Settings()
+
+
+settings = get_settings()
@@ -0,0 +1,10 @@
+from app.core.database import Base, engine
+from app.models import item, user  # register tables on Base.metadata
+
+
+def init_db() -> None:
+    Base.metadata.create_all(bind=engine)
+
+
+if __name__ == "__main__":
+    init_db()
@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+import bcrypt
+from jose import JWTError, jwt
+from app.core.config import settings
+
+ALGORITHM = "HS256"
+
+# bcrypt only uses the first 72 bytes; bcrypt>=5 raises instead of truncating
+BCRYPT_MAX_BYTES = 72
+
+
+def hash_password(password: str) -> str:
+    secret = password.encode()[:BCRYPT_MAX_BYTES]
+    return bcrypt.hashpw(secret, bcrypt.gensalt(rounds=12)).decode()
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    secret = plain_password.encode()[:BCRYPT_MAX_BYTES]
+    try:
+        return bcrypt.checkpw(secret, hashed_password.encode())
+    except ValueError:
+        # Malformed stored hash ("Invalid salt")
+        return False
+
+
+def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
+    to_encode = data.copy()
+    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=15))
+    to_encode.update({"exp": expire})
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_token(token: str) -> dict | None:
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+        return payload
+    except JWTError:
+        return None
@@ -0,0 +1,15 @@
+def test_created_item_is_listed_immediately(client):
+    client.post("/api/v1/users/", json={"email": "owner@example.com", "password": "secret"})
+    token = client.post(
+        "/api/v1/auth/token",
+        data={"username": "owner@example.com", "password": "secret"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/v1/items/").json() == []
+
+    response = client.post("/api/v1/items/", json={"name": "Widget", "price": 9.5}, headers=headers)
+    assert response.status_code == 200
+
+    items = client.get("/api/v1/items/").json()
+    assert [item["name"] for item in items] == ["Widget"]
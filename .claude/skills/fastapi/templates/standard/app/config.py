@@ -0,0 +1,14 @@
+from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+
+class Settings(BaseSettings):
+    app_name: str = "My API"
+    debug: bool = False
+
+    model_config = {"env_file": ".env"}
+
+
+@lru_cache
+def get_settings():
+    return Settings()
@@ -0,0 +1,17 @@
+from fastapi import FastAPI
+from app.routers import items, users
+
+app = FastAPI(title="My API", version="0.1.0")
+
+app.include_router(users.router, prefix="/users", tags=["users"])
+app.include_router(items.router, prefix="/items", tags=["items"])
+
+
+@app.get("/")
+def root():
+    return {"message": "Welcome to the API"}
+
+
+@app.get("/health")
+def health():
+    return {"status": "healthy"}
@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+router = APIRouter()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    description: str | None = None
+
+
+@router.get("/")
+def list_items():
+    return []
+
+
+@router.post("/")
+def create_item(item: Item):
+    return item
@@ -1,11 +1,17 @@
 import os
+import threading
 
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy import delete, update
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, Field, create_engine, Session, select
-from dotenv import load_dotenv
 
-load_dotenv()
+# Skip reading .env when the environment already provides DB_URL (e.g. in containers)
+if not os.environ.get("DB_URL"):
+    from dotenv import load_dotenv
+
+    load_dotenv(override=False)
 DATABASE_URL = os.getenv("DB_URL")
 
 app = FastAPI()
@@ -13,7 +19,12 @@ app = FastAPI()
 if not DATABASE_URL:
     raise RuntimeError("DB_URL is not set in environment variables")
 
-engine = create_engine(DATABASE_URL, echo=True)
+# Statement logging is opt-in; a larger compiled cache keeps the hot CRUD queries compiled
+engine = create_engine(
+    DATABASE_URL,
+    echo=os.getenv("SQL_ECHO") == "1",
+    query_cache_size=1200,
+)
 
 
 #DB Structure/Tables + same used at API level
@@ -23,8 +34,12 @@ class Todo(SQLModel, table=True):
     description: str | None = Field(default=None)
 
 
+# Attributes stay loaded after commit, so writes don't need a refresh SELECT
+SessionLocal = sessionmaker(engine, class_=Session, expire_on_commit=False, autoflush=False)
+
+
 def get_session():
-    with Session(engine) as session:
+    with SessionLocal() as session:
         yield session
 
 
@@ -32,22 +47,57 @@ def get_session():
 def create_todo(todo: Todo, session: Session = Depends(get_session)):
     session.add(todo)
     session.commit()
-    session.refresh(todo)
     return todo
 
 
 @app.get("/allTodo")
-def all_todo(session: Session = Depends(get_session)):
-    todos = session.exec(select(Todo)).all()
+def all_todo(
+    session: Session = Depends(get_session),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    after_id: int | None = Query(None, ge=0),
+):
+    statement = select(Todo).order_by(Todo.id)
+    if after_id is not None:
+        # Keyset pagination walks the primary-key index instead of skipping rows
+        statement = statement.where(Todo.id > after_id)
+    todos = session.exec(statement.offset(skip).limit(limit)).all()
     return todos
 
 
+# Per-process cache of serialized todos; PUT/DELETE evict the entry they touch.
+# Sync endpoints run in a threadpool, so a fill only lands if no invalidation
+# happened since its read (tracked by _TODO_CACHE_GENERATION).
+_TODO_CACHE: dict[int, dict] = {}
+_TODO_CACHE_SIZE = 1024
+_TODO_CACHE_LOCK = threading.Lock()
+_TODO_CACHE_GENERATION = 0
+
+
+def _invalidate_todo(todo_id: int) -> None:
+    global _TODO_CACHE_GENERATION
+    with _TODO_CACHE_LOCK:
+        _TODO_CACHE_GENERATION += 1
+        _TODO_CACHE.pop(todo_id, None)
+
+
 @app.get("/todo/{todo_id}")
 def todo_by_id(todo_id: int, session: Session = Depends(get_session)):
+    with _TODO_CACHE_LOCK:
+        cached = _TODO_CACHE.get(todo_id)
+        generation = _TODO_CACHE_GENERATION
+    if cached is not None:
+        return cached
     todo = session.get(Todo, todo_id)
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
-    return todo
+    data = todo.model_dump()
+    with _TODO_CACHE_LOCK:
+        if generation == _TODO_CACHE_GENERATION:
+            if len(_TODO_CACHE) >= _TODO_CACHE_SIZE:
+                _TODO_CACHE.pop(next(iter(_TODO_CACHE)), None)
+            _TODO_CACHE[todo_id] = data
+    return data
 
 
 class TodoUpdate(BaseModel):
@@ -57,26 +107,30 @@ class TodoUpdate(BaseModel):
 
 @app.put("/todo/{todo_id}")
 def update_todo(todo_id: int, todo_update: TodoUpdate, session: Session = Depends(get_session)):
-    todo = session.get(Todo, todo_id)
+    patch = todo_update.model_dump(exclude_none=True)
+    if not patch:
+        todo = session.get(Todo, todo_id)
+        if not todo:
+            raise HTTPException(status_code=404, detail="Todo not found")
+        return todo
+    # Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE + refresh
+    todo = session.exec(
+        update(Todo).where(Todo.id == todo_id).values(**patch).returning(Todo)
+    ).scalar_one_or_none()
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
-    if todo_update.title is not None:
-        todo.title = todo_update.title
-    if todo_update.description is not None:
-        todo.description = todo_update.description
-    session.add(todo)
     session.commit()
-    session.refresh(todo)
+    _invalidate_todo(todo_id)
     return todo
 
 
 @app.delete("/todo/{todo_id}")
 def delete_todo(todo_id: int, session: Session = Depends(get_session)):
-    todo = session.get(Todo, todo_id)
-    if not todo:
+    result = session.exec(delete(Todo).where(Todo.id == todo_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Todo not found")
-    session.delete(todo)
     session.commit()
+    _invalidate_todo(todo_id)
     return {"message": "Todo deleted successfully"}
 
 
@@ -1,32 +1,61 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlmodel import SQLModel, Session, create_engine
 from sqlmodel.pool import StaticPool
 
-from main import app, get_session, Todo
+from main import app, get_session, SessionLocal, Todo, _TODO_CACHE
 
 
-@pytest.fixture(name="session")
-def session_fixture():
+@pytest.fixture(name="engine", scope="module")
+def engine_fixture():
     engine = create_engine(
         "sqlite://",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest inside the outer transaction
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    # Each test runs in a transaction that is rolled back, so the schema is built once per module
+    connection = engine.connect()
+    transaction = connection.begin()
+    with SessionLocal(bind=connection, join_transaction_mode="create_savepoint") as session:
         yield session
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture():
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
+def client_fixture(test_client: TestClient, session: Session):
     def get_session_override():
         return session
 
     app.dependency_overrides[get_session] = get_session_override
-    client = TestClient(app)
-    yield client
+    yield test_client
     app.dependency_overrides.clear()
+    # Rows are rolled back between tests, so cached todos must go too
+    _TODO_CACHE.clear()
 
 
 def test_create_todo(client: TestClient):
@@ -53,6 +82,30 @@ def test_get_all_todos(client: TestClient):
     assert data[1]["title"] == "Todo 2"
 
 
+def test_get_all_todos_paginated(client: TestClient):
+    for i in range(3):
+        client.post("/createTodo", json={"title": f"Todo {i}", "description": None})
+
+    response = client.get("/allTodo", params={"skip": 1, "limit": 1})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["title"] == "Todo 1"
+
+    response = client.get("/allTodo", params={"after_id": data[0]["id"]})
+    assert response.status_code == 200
+    assert [todo["title"] for todo in response.json()] == ["Todo 2"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"skip": -1}, {"limit": 0}, {"limit": -1}, {"limit": 10**9}, {"after_id": -1}],
+)
+def test_get_all_todos_invalid_pagination(client: TestClient, params: dict):
+    response = client.get("/allTodo", params=params)
+    assert response.status_code == 422
+
+
 def test_get_todo_by_id(client: TestClient):
     create_response = client.post(
         "/createTodo",
@@ -90,6 +143,21 @@ def test_update_todo(client: TestClient):
     assert data["description"] == "Updated Desc"
 
 
+def test_get_todo_by_id_after_update(client: TestClient):
+    create_response = client.post(
+        "/createTodo",
+        json={"title": "Cached Title", "description": "Cached Desc"},
+    )
+    todo_id = create_response.json()["id"]
+    assert client.get(f"/todo/{todo_id}").json()["title"] == "Cached Title"
+
+    client.put(f"/todo/{todo_id}", json={"title": "Fresh Title"})
+
+    response = client.get(f"/todo/{todo_id}")
+    assert response.status_code == 200
+    assert response.json()["title"] == "Fresh Title"
+
+
 def test_update_todo_partial(client: TestClient):
     create_response = client.post(
         "/createTodo",
@@ -125,6 +193,21 @@ def test_delete_todo(client: TestClient):
     assert get_response.status_code == 404
 
 
+def test_delete_cached_todo(client: TestClient):
+    create_response = client.post(
+        "/createTodo",
+        json={"title": "Cached Delete", "description": "Read before delete"},
+    )
+    todo_id = create_response.json()["id"]
+    assert client.get(f"/todo/{todo_id}").status_code == 200
+
+    response = client.delete(f"/todo/{todo_id}")
+    assert response.status_code == 200
+
+    get_response = client.get(f"/todo/{todo_id}")
+    assert get_response.status_code == 404
+
+
 def test_delete_todo_not_found(client: TestClient):
     response = client.delete("/todo/999")
     assert response.status_code == 404